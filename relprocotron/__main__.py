@@ -1,58 +1,235 @@
 #!/usr/bin/env python3
 """CLI entrypoint for Release Process-O-Tron."""
 
+import datetime
+import email.utils
+import functools
 import json
 import logging
+import os
+import random
+import re
+import tempfile
+import threading
 import time
-import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, metadata
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
-import requests
-from jinja2 import Environment, FileSystemLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import requests
+    from jinja2 import Environment, Template
+
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # orjson is an optional speedup (the "fast" extra); fall back to stdlib json
+    _HAVE_ORJSON = False
 
 logging.basicConfig(level=logging.INFO)
 
+# Reused by the stdlib escaping fallback; json.dumps builds a new encoder per call for non-default options
+_JSON_STRING_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _json_loads(data: str | bytes) -> Any:  # noqa: ANN401 - arbitrary JSON document
+    """Decode a JSON document, using orjson when it is installed."""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _escape_json_string(value: Any) -> str:  # noqa: ANN401 - Jinja passes any expression result
+    """Escape a rendered template value for use inside a JSON string literal."""
+    if _HAVE_ORJSON:
+        try:
+            return orjson.dumps(str(value))[1:-1].decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects strings that are not valid UTF-8, such as lone surrogates from undecodable
+            # command line bytes; the stdlib escapes them, and writing the output then reports the error
+            pass
+    return _JSON_STRING_ENCODER.encode(str(value))[1:-1]
+
+
+# Paths are resolved once at import so they do not depend on later working directory changes
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_TEMPLATE_DIR = _PACKAGE_DIR / "templates"
+_PYPROJECT_PATH = _PACKAGE_DIR.parent / "pyproject.toml"
+_RELEASE_TEMPLATE_NAME = "release_process_o_tron.j2.json"
+
+# Write buffer size for generated release files
+_OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Output file name that writes the generated release to standard output instead
+_STDOUT_OUTPUT = "-"
+
+# GitHub API (connect, read) timeouts in seconds; a short connect timeout fails fast on network problems
+_REQUEST_TIMEOUT = (3.05, 30)
+_SUPPORTED_HTTP_METHODS = frozenset({"GET", "POST", "PATCH"})
+
+# Retry backoff is capped, and jittered so concurrent requests don't retry in lockstep
+_MAX_RETRY_DELAY = 60.0
+_RETRY_JITTER = 0.5
+
+# Longest server-requested Retry-After wait to sit out; a longer rate limit aborts the run instead
+_MAX_RETRY_AFTER = 300.0
+
+# Sort priority assumed for tasks that do not declare one
+_DEFAULT_PRIORITY = 999
+
+# Upper bound on in-flight GitHub API requests, and on HTTP sessions, when creating issues
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Release dates must be exactly YYYY-MM-DD; date.fromisoformat alone also accepts forms such as 20250120 and 2025-W03-1
+_ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+# Supported release types, shared by the CLI option and batch validation
+_RELEASE_TYPES = ["LTS", "dev", "experimental", "early-access"]
+
+# Fields of one release object in a --batch JSON Lines file
+_BATCH_RELEASE_FIELDS = frozenset(
+    {
+        "release_name",
+        "release_tag",
+        "release_type",
+        "release_date",
+        "project_url",
+        "software_name",
+        "software_version",
+        "comments",
+        "output_file",
+    }
+)
+
+# Log format for the parameter verification banner, built once rather than on every run
+_PARAMETER_SUMMARY_FORMAT = "\n".join(
+    [
+        "%s v%s - Parameter Verification",
+        "=" * 50,
+        "Release Name: %s",
+        "Release Tag: %s",
+        "Release Type: %s",
+        "Release Date: %s",
+        "Project URL: %s",
+        "Dry Run: %s",
+        "Software Name: %s",
+        "Software Version: %s",
+        "Comments: %s",
+        "Output File: %s",
+    ]
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_environment() -> "Environment":
+    """Create the Jinja2 environment used for all release templates.
+
+    Jinja2 is imported here so that --help and --version never pay for it. The bytecode
+    cache persists compiled templates across CLI invocations in a per-user temp directory,
+    and is skipped when no usable temp directory exists (e.g. read-only containers).
+    Cache entries are keyed only on the template source, while environment settings such
+    as `finalize` are compiled into them, so the cache is namespaced by package version.
+    Every expression is JSON-escaped, so the rendered output is valid JSON as written.
+    """
+    from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    bytecode_cache: BytecodeCache | None
+    try:
+        bytecode_cache = FileSystemBytecodeCache(pattern=f"__relprocotron_{_VERSION}_%s.cache")
+    except (OSError, RuntimeError):
+        logging.debug("Template bytecode cache unavailable; compiling templates in memory.")
+        bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=False,  # noqa: S701 - JSON output, not HTML
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        finalize=_escape_json_string,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_template(name: str = _RELEASE_TEMPLATE_NAME) -> "Template":
+    """Load and compile a template once per process, skipping the loader lookup on reuse."""
+    return _get_environment().get_template(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pyproject() -> dict[str, Any]:
+    """Read and parse pyproject.toml in the project root once per process."""
+    import tomllib
 
-def _get_value_from_pyproject(valkey: str) -> str:
-    """Extract value from pyproject.toml in the project root using tomllib."""
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
     try:
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
-        # Try PEP 621-compliant location first
-        if "project" in data and valkey in data["project"]:
-            return str(data["project"][valkey])
+        with _PYPROJECT_PATH.open("rb") as f:
+            return tomllib.load(f)
     except Exception:
         logging.getLogger(__name__).error("Failed to read or parse pyproject.toml for version.")
         raise
-    return "unknown"
+
+
+def _get_value_from_pyproject(valkey: str) -> str:
+    """Extract value from the PEP 621 project table of pyproject.toml."""
+    return str(_load_pyproject().get("project", {}).get(valkey, "unknown"))
+
+
+def _get_package_metadata() -> tuple[str, str]:
+    """Return the distribution name and version, preferring installed package metadata."""
+    try:
+        dist_metadata = metadata("release-process-o-tron")
+        return dist_metadata["Name"], dist_metadata["Version"]
+    except PackageNotFoundError:
+        # Running from a source checkout that has not been installed
+        return _get_value_from_pyproject("name"), _get_value_from_pyproject("version")
+
+
+_NAME, _VERSION = _get_package_metadata()
+
+
+class IsoDate(click.ParamType):
+    """Click parameter type that validates a YYYY-MM-DD date and returns it as a string."""
+
+    name = "date"
+
+    def convert(self, value: Any, param: click.Parameter | None, ctx: click.Context | None) -> str:  # noqa: ANN401
+        """Validate the date at parse time so bad input fails before any output is rendered."""
+        date_string = str(value)
+        if _ISO_DATE_PATTERN.fullmatch(date_string):
+            try:
+                return datetime.date.fromisoformat(date_string).isoformat()
+            except ValueError:
+                pass  # Well-formed but not a calendar date, such as 2025-02-30
+        self.fail(f"{value!r} is not a valid date in YYYY-MM-DD format", param, ctx)
 
 
 @click.command()
 @click.help_option("-h", "--help")
 @click.version_option(
-    _get_value_from_pyproject("version"),
+    _VERSION,
     "-v",
     "--version",
-    prog_name=_get_value_from_pyproject("name"),
+    prog_name=_NAME,
     message="%(prog)s v%(version)s",
-)  # Dynamic version from pyproject.toml
-@click.option("-n", "--release-name", type=str, required=True, help="Name of the release")
-@click.option("-t", "--release-tag", type=str, required=True, help="Git tag for the release")
+)  # Dynamic version from package metadata
+@click.option("-n", "--release-name", type=str, help="Name of the release")
+@click.option("-t", "--release-tag", type=str, help="Git tag for the release")
 @click.option(
     "-y",
     "--release-type",
-    type=click.Choice(["LTS", "dev", "experimental", "early-access"], case_sensitive=True),
-    required=True,
+    type=click.Choice(_RELEASE_TYPES, case_sensitive=True),
     help="Type of release (LTS, dev, experimental, early-access)",
 )
-@click.option("-d", "--release-date", type=str, required=True, help="Release date in YYYY-MM-DD format")
-@click.option("-u", "--project-url", type=str, required=True, help="URL of the project repository")
+@click.option("-d", "--release-date", type=IsoDate(), help="Release date in YYYY-MM-DD format")
+@click.option("-u", "--project-url", type=str, help="URL of the project repository")
 @click.option("-r", "--dry-run", is_flag=True, default=False, help="Perform a dry run without making actual changes")
-@click.option("-s", "--software-name", type=str, required=True, help="Name of the software being released")
-@click.option("-S", "--software-version", type=str, required=True, help="Version of the software being released")
+@click.option("-s", "--software-name", type=str, help="Name of the software being released")
+@click.option("-S", "--software-version", type=str, help="Version of the software being released")
 @click.option(
     "-c",
     "--comment",
@@ -70,7 +247,18 @@ def _get_value_from_pyproject(valkey: str) -> str:
     "--github-repo", type=str, help="GitHub repository in format owner/repo (required when --create-issues is used)"
 )
 @click.option("--github-token", type=str, help="GitHub personal access token (required when --create-issues is used)")
-@click.option("-o", "--output-file", type=str, required=True, help="Path to output JSON file for release activities")
+@click.option(
+    "-o",
+    "--output-file",
+    type=str,
+    help=f"Path to output JSON file for release activities, or {_STDOUT_OUTPUT} for standard output",
+)
+@click.option(
+    "--batch",
+    "batch_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to a JSON Lines file of releases to generate, one object of release options per line",
+)
 @click.option("-V", "--verbose", is_flag=True, default=False, help="Enable verbose (DEBUG) logging")
 def main(
     release_name: str | None,
@@ -82,11 +270,12 @@ def main(
     software_name: str | None,
     software_version: str | None,
     comment: tuple[str, ...],
-    output_file: str,
+    output_file: str | None,
     create_issues: bool,
     input_file: str | None,
     github_repo: str | None,
     github_token: str | None,
+    batch_file: str | None,
     verbose: bool,
 ) -> None:
     """Release Process-O-Tron CLI tool.
@@ -98,59 +287,67 @@ def main(
         logging.getLogger().setLevel(logging.DEBUG)
         logging.debug("Verbose mode enabled: log level set to DEBUG.")
 
+    release_options = {
+        "--release-name": release_name,
+        "--release-tag": release_tag,
+        "--release-type": release_type,
+        "--release-date": release_date,
+        "--project-url": project_url,
+        "--software-name": software_name,
+        "--software-version": software_version,
+        "--output-file": output_file,
+    }
+
+    # Handle batch generation mode, where the batch file supplies every release option
+    if batch_file:
+        other_options = {
+            **release_options,
+            "--comment": comment,
+            "--dry-run": dry_run,
+            "--create-issues": create_issues,
+            "--input-file": input_file,
+            "--github-repo": github_repo,
+            "--github-token": github_token,
+        }
+        if given_options := [option for option, value in other_options.items() if value]:
+            raise click.UsageError(f"--batch cannot be combined with: {', '.join(given_options)}")
+        _generate_release_batch(batch_file)
+        return
+
     # Handle GitHub issue creation mode
     if create_issues:
         if not input_file or not github_repo or not github_token:
-            click.echo("Error: --create-issues requires --input-file, --github-repo, and --github-token", err=True)
-            raise click.ClickException("Missing required options for issue creation")
+            raise click.UsageError(
+                "Missing required options for issue creation: "
+                "--create-issues requires --input-file, --github-repo, and --github-token"
+            )
 
         _create_github_issues(input_file, github_repo, github_token, dry_run)
         return
 
     # For JSON generation mode, check required parameters
-    required_params = [
+    if missing_options := [option for option, value in release_options.items() if not value]:
+        raise click.UsageError(f"Missing required options for JSON generation: {', '.join(missing_options)}")
+
+    # Convert tuple to list for consistency with type hint
+    comment_list: list[str] = list(comment)
+
+    # Log all received parameters for verification as one record, formatted only if INFO is enabled
+    logging.info(
+        _PARAMETER_SUMMARY_FORMAT,
+        _NAME,
+        _VERSION,
         release_name,
         release_tag,
         release_type,
         release_date,
         project_url,
+        dry_run,
         software_name,
         software_version,
+        comment_list,
         output_file,
-    ]
-    if not all(required_params):
-        click.echo("Error: Missing required options for JSON generation", err=True)
-        required_options = [
-            "--release-name",
-            "--release-tag",
-            "--release-type",
-            "--release-date",
-            "--project-url",
-            "--software-name",
-            "--software-version",
-            "--output-file",
-        ]
-        click.echo(f"Required: {', '.join(required_options)}")
-        raise click.ClickException("Missing required options for JSON generation")
-
-    # Convert tuple to list for consistency with type hint
-    comment_list: list[str] = list(comment)
-
-    # Log all received parameters for verification
-    logging.info(
-        f"{_get_value_from_pyproject('name')} v{_get_value_from_pyproject('version')} - Parameter Verification"
     )
-    logging.info("=" * 50)
-    logging.info(f"Release Name: {release_name}")
-    logging.info(f"Release Tag: {release_tag}")
-    logging.info(f"Release Type: {release_type}")
-    logging.info(f"Release Date: {release_date}")
-    logging.info(f"Project URL: {project_url}")
-    logging.info(f"Dry Run: {dry_run}")
-    logging.info(f"Software Name: {software_name}")
-    logging.info(f"Software Version: {software_version}")
-    logging.info(f"Comments: {comment_list}")
-    logging.info(f"Output File: {output_file}")
 
     # Generate release activities JSON
     _generate_release_activities(
@@ -162,10 +359,11 @@ def main(
         software_name=software_name,  # type: ignore[arg-type]
         software_version=software_version,  # type: ignore[arg-type]
         comments=comment_list,
-        output_file=output_file,
+        output_file=output_file,  # type: ignore[arg-type]
     )
 
-    click.echo(f"\nRelease activities written to: {output_file}")
+    if output_file != _STDOUT_OUTPUT:
+        click.echo(f"\nRelease activities written to: {output_file}")
 
 
 def _generate_release_activities(
@@ -179,16 +377,9 @@ def _generate_release_activities(
     comments: list[str],
     output_file: str,
 ) -> None:
-    """Generate release activities JSON from template."""
-    # Get template directory
-    template_dir = Path(__file__).parent / "templates"
-
-    # Set up Jinja2 environment
-    env = Environment(loader=FileSystemLoader(template_dir))  # noqa: S701 - JSON output, not HTML
-    template = env.get_template("release_process_o_tron.j2.json")
-
-    # Render template with provided data
-    rendered_json = template.render(
+    """Generate release activities JSON from template, to a file or to standard output."""
+    # Stream rendered JSON to the output as-is; the template escapes every value
+    chunks = _get_template().generate(
         release_name=release_name,
         release_tag=release_tag,
         release_type=release_type,
@@ -198,16 +389,106 @@ def _generate_release_activities(
         software_version=software_version,
         comments=comments,
     )
+    try:
+        if output_file == _STDOUT_OUTPUT:
+            # Write UTF-8 bytes, as for files, whatever the console's locale encoding is. The document is
+            # encoded in full first so that a failure does not leave partial JSON on standard output.
+            stdout = click.get_binary_stream("stdout")
+            stdout.write("".join(chunks).encode("utf-8"))
+            stdout.flush()
+        else:
+            _write_output_file(Path(output_file), chunks)
+    except UnicodeEncodeError as e:
+        raise click.ClickException(f"Release values must be valid UTF-8 text: {e}") from e
+
+
+def _write_output_file(output_path: Path, chunks: "Iterable[str]") -> None:
+    """Write chunks to a file, replacing it only once every chunk has been written."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Parse to validate JSON format
-    parsed_data = json.loads(rendered_json)
+    # Write to a temporary file beside the output and move it into place on success, so a failed
+    # render neither leaves a truncated file nor replaces a previous good one
+    fd, temp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    temp_path = Path(temp_name)
+    try:
+        # mkstemp creates the file readable by its owner only; give it the permissions a new file would get
+        umask = os.umask(0)
+        os.umask(umask)
+        temp_path.chmod(0o666 & ~umask)
+        # A large buffer coalesces the many small template chunks into a few writes
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        temp_path.replace(output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-    # Write formatted JSON to output file
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+def _generate_release_batch(batch_file: str) -> None:
+    """Generate release activities for every release in a JSON Lines batch file.
+
+    Each non-blank line is an object with the keyword arguments of
+    `_generate_release_activities`; `comments` is optional. All releases share the
+    compiled template, so its compile cost is paid once for the whole batch.
+    """
+    # Every line is validated before any release is written, so a bad line leaves no partial output
+    for release in _read_release_batch(batch_file):
+        _generate_release_activities(**release)
+        click.echo(f"Release activities written to: {release['output_file']}")
+
+
+def _read_release_batch(batch_file: str) -> list[dict[str, Any]]:
+    """Parse and validate every release in a JSON Lines batch file."""
+    releases: list[dict[str, Any]] = []
+    with Path(batch_file).open("r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                release = _json_loads(line)
+            except ValueError as e:
+                raise click.ClickException(f"Invalid JSON on line {line_number} of {batch_file}: {e}") from e
+            if not isinstance(release, dict):
+                raise click.ClickException(f"Line {line_number} of {batch_file} must be a JSON object")
+
+            release.setdefault("comments", [])
+            if missing_fields := sorted(_BATCH_RELEASE_FIELDS - release.keys()):
+                raise click.ClickException(
+                    f"Release on line {line_number} of {batch_file} is missing fields: {', '.join(missing_fields)}"
+                )
+            if unknown_fields := sorted(release.keys() - _BATCH_RELEASE_FIELDS):
+                raise click.ClickException(
+                    f"Release on line {line_number} of {batch_file} has unknown fields: {', '.join(unknown_fields)}"
+                )
+            if invalid_fields := sorted(
+                field
+                for field in _BATCH_RELEASE_FIELDS - {"comments"}
+                if not isinstance(release[field], str) or not release[field]
+            ):
+                raise click.ClickException(
+                    f"Release on line {line_number} of {batch_file} must have non-empty string values for: "
+                    f"{', '.join(invalid_fields)}"
+                )
+            comments = release["comments"]
+            if not isinstance(comments, list) or not all(isinstance(comment, str) for comment in comments):
+                raise click.ClickException(f"Comments on line {line_number} of {batch_file} must be a list of strings")
+            if release["output_file"] == _STDOUT_OUTPUT:
+                raise click.ClickException(
+                    f"Release on line {line_number} of {batch_file} cannot write to standard output in batch mode"
+                )
+            if release["release_type"] not in _RELEASE_TYPES:
+                raise click.ClickException(
+                    f"Invalid release type {release['release_type']!r} on line {line_number} of {batch_file}"
+                )
+            try:
+                release["release_date"] = IsoDate().convert(release["release_date"], None, None)
+            except click.BadParameter as e:
+                raise click.ClickException(f"{e.message} on line {line_number} of {batch_file}") from e
+
+            releases.append(release)
+
+    return releases
 
 
 class GitHubClient:
@@ -223,14 +504,48 @@ class GitHubClient:
         self.token = token
         self.repo = repo
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
-        self.session.headers.update(
+        # requests.Session is not documented as thread-safe, so each thread gets its own
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def open_session(self) -> None:
+        """Open an HTTP session for the calling thread.
+
+        Used as the initializer of the issue creation thread pool, so each worker opens one session and
+        reuses its connection for every request it sends.
+        """
+        # Imported here so that runs which never reach GitHub do not load requests and urllib3
+        import requests
+
+        session = requests.Session()
+        # A session serves one thread and one host, so it only ever needs one pooled connection
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.headers.update(
             {
-                "Authorization": f"token {token}",
+                "Authorization": f"token {self.token}",
                 "Accept": "application/vnd.github.v3+json",
                 "User-Agent": "release-process-o-tron",
             }
         )
+        self._local.session = session
+        with self._sessions_lock:
+            self._sessions.append(session)
+
+    @property
+    def session(self) -> "requests.Session":
+        """The HTTP session of the calling thread, opened on first use."""
+        if not hasattr(self._local, "session"):
+            self.open_session()
+        session: requests.Session = self._local.session
+        return session
+
+    def close(self) -> None:
+        """Close every session opened by this client."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
 
     def _make_request(
         self,
@@ -253,29 +568,33 @@ class GitHubClient:
             Response data as dictionary
 
         Raises:
+            ValueError: If the HTTP method is not supported
+            click.ClickException: If GitHub asks to wait longer than the client is willing to
             requests.RequestException: If request fails after all retries
         """
+        import requests
+
+        method = method.upper()
+        if method not in _SUPPORTED_HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(max_retries + 1):
             try:
-                if method.upper() == "GET":
-                    response = self.session.get(url, timeout=30)
-                elif method.upper() == "POST":
-                    response = self.session.post(url, json=data, timeout=30)
-                elif method.upper() == "PATCH":
-                    response = self.session.patch(url, json=data, timeout=30)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self.session.request(method, url, json=data, timeout=_REQUEST_TIMEOUT)
 
                 # Handle rate limiting with backoff
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", base_delay * (2**attempt)))
-                    if attempt < max_retries:
-                        msg = f"Rate limited, waiting {retry_after} seconds before retry {attempt + 1}/{max_retries}"
-                        click.echo(msg)
-                        time.sleep(retry_after)
-                        continue
+                if _is_rate_limited(response) and attempt < max_retries:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    # Requests sent while still rate limited can get an integration banned, so a wait
+                    # that is too long to sit out ends the run rather than being shortened
+                    if retry_after is not None and retry_after > _MAX_RETRY_AFTER:
+                        raise click.ClickException(f"GitHub rate limit exceeded; retry after {retry_after:.0f} seconds")
+                    delay = _retry_delay(attempt, base_delay, retry_after)
+                    click.echo(f"Rate limited, waiting {delay:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                    time.sleep(delay)
+                    continue
 
                 # Handle successful responses
                 if response.status_code in (200, 201):
@@ -287,16 +606,16 @@ class GitHubClient:
 
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 if attempt < max_retries:
-                    delay = base_delay * (2**attempt)
-                    msg = f"Request failed, retrying in {delay} seconds (attempt {attempt + 1}/{max_retries}): {e}"
+                    delay = _retry_delay(attempt, base_delay)
+                    msg = f"Request failed, retrying in {delay:.1f} seconds (attempt {attempt + 1}/{max_retries}): {e}"
                     click.echo(msg)
                     time.sleep(delay)
                     continue
                 raise
             except requests.exceptions.RequestException:
                 if attempt < max_retries:
-                    delay = base_delay * (2**attempt)
-                    click.echo(f"Request failed, retrying in {delay} seconds (attempt {attempt + 1}/{max_retries})")
+                    delay = _retry_delay(attempt, base_delay)
+                    click.echo(f"Request failed, retrying in {delay:.1f} seconds (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                     continue
                 raise
@@ -345,6 +664,42 @@ class GitHubClient:
         return self._make_request("PATCH", f"/repos/{self.repo}/issues/{issue_number}", kwargs)
 
 
+def _is_rate_limited(response: "requests.Response") -> bool:
+    """Return whether a response is a rate limit rejection.
+
+    Besides 429, GitHub rejects requests over its secondary rate limits with a 403 carrying Retry-After.
+    """
+    return response.status_code == 429 or (response.status_code == 403 and "Retry-After" in response.headers)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the wait in seconds requested by a Retry-After header, or None if it is absent or malformed.
+
+    The header is either a number of seconds or an HTTP-date.
+    """
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
+
+
+def _retry_delay(attempt: int, base_delay: float, retry_after: float | None = None) -> float:
+    """Delay with random jitter for the given retry attempt.
+
+    Uses the server-requested wait as given when there is one, and capped exponential backoff otherwise.
+    """
+    delay = min(_MAX_RETRY_DELAY, base_delay * 2.0**attempt) if retry_after is None else retry_after
+    jitter = random.uniform(0, _RETRY_JITTER)  # noqa: S311 - jitter only, not used for security
+    return delay + jitter
+
+
 def _create_github_issues(input_file: str, github_repo: str, github_token: str, dry_run: bool) -> None:
     """Create GitHub issues from JSON file."""
     # Check if input file exists first
@@ -353,66 +708,103 @@ def _create_github_issues(input_file: str, github_repo: str, github_token: str,
         raise click.ClickException(f"Input file not found: {input_file}")
 
     # Load JSON data
-    with input_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _json_loads(input_path.read_bytes())
 
     click.echo(f"Creating GitHub issues for release: {data['release']['name']}")
+
+    # Sort tasks and their children by priority, in place, for proper ordering
+    tasks: list[dict[str, Any]] = data["tasks"]
+    tasks.sort(key=_task_priority)
+    for task in tasks:
+        task.get("children", []).sort(key=_task_priority)
+
     if dry_run:
-        click.echo("DRY RUN: No actual issues will be created")
+        _preview_github_issues(tasks)
+        return
+
+    try:
+        github_client = GitHubClient(github_token, github_repo)
+    except Exception as e:
+        raise click.ClickException(f"Failed to initialize GitHub client: {e}") from e
+
+    # Build every issue body up front so the worker threads below only wait on the network
+    parent_jobs = [(task, _build_issue_body(task)) for task in tasks]
+    child_jobs = [
+        (parent_index, child_task, _build_issue_body(child_task))
+        for parent_index, task in enumerate(tasks)
+        for child_task in task.get("children", [])
+    ]
+
+    # Issue creation is latency-bound, so requests are issued concurrently, each worker reusing its
+    # own session. Results from executor.map keep priority order, which the sub-task lists below
+    # rely on; issue numbers follow the order GitHub receives the requests in.
+    executor = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS, initializer=github_client.open_session)
+    try:
+        # Create issues for all top-level tasks
+        parent_issues = list(executor.map(lambda job: _create_issue_from_task(github_client, *job), parent_jobs))
+
+        # Child issues reference their parent issue number, so they are created once all parents exist
+        child_issues = list(
+            executor.map(
+                lambda job: _create_issue_from_task(github_client, job[1], job[2], parent_issues[job[0]]),
+                child_jobs,
+            )
+        )
+
+        # Build task list of children (sub-issues) for each parent issue
+        child_task_lists: dict[int, list[str]] = {}
+        for (parent_index, child_task, _), child_issue in zip(child_jobs, child_issues, strict=True):
+            if child_issue:
+                child_task_lists.setdefault(parent_index, []).append(
+                    f"- [ ] #{child_issue['number']} {child_task['title']}"
+                )
+
+        # Update parent issues with task list of children (sub-issues)
+        updates = [
+            (parent_issue, child_task_lists[parent_index])
+            for parent_index, parent_issue in enumerate(parent_issues)
+            if parent_issue and parent_index in child_task_lists
+        ]
+        list(executor.map(lambda update: _add_sub_task_list(github_client, *update), updates))
+    finally:
+        # Queued requests are not started if the run ends early, e.g. on a rate limit too long to wait out
+        executor.shutdown(cancel_futures=True)
+        github_client.close()
+
+    total_created = sum(1 for issue in (*parent_issues, *child_issues) if issue)
+    click.echo(f"Successfully created {total_created} issues")
 
-    # Initialize GitHub client only if not doing a dry run
-    github_client = None
-    if not dry_run:
-        try:
-            github_client = GitHubClient(github_token, github_repo)
-        except Exception as e:
-            raise click.ClickException(f"Failed to initialize GitHub client: {e}") from e
 
-    # Sort tasks by priority for proper ordering
-    tasks = sorted(data["tasks"], key=lambda x: x.get("priority", 999))
+def _task_priority(task: dict[str, Any]) -> int:
+    """Sort key that orders tasks by priority, placing tasks without one last."""
+    return int(task.get("priority", _DEFAULT_PRIORITY))
 
-    # Track created issues for parent-child relationships
-    created_issues: dict[str, dict[str, Any]] = {}
-    total_created = 0
 
-    # Create issues for all top-level tasks
+def _preview_github_issues(tasks: list[dict[str, Any]]) -> None:
+    """List the issues a real run would create, without building issue bodies."""
+    # The preview is pure CPU work, so it is written with a single echo
+    lines = ["DRY RUN: No actual issues will be created"]
     for task in tasks:
-        parent_issue = _create_issue_from_task(github_client, task, None, dry_run)
-        if parent_issue:
-            created_issues[task["title"]] = parent_issue
-            total_created += 1
-
-        # Create child issues if they exist, sorted by priority
-        if "children" in task:
-            child_tasks = sorted(task["children"], key=lambda x: x.get("priority", 999))
-            child_task_list = []
-
-            for child_task in child_tasks:
-                child_issue = _create_issue_from_task(github_client, child_task, parent_issue, dry_run)
-                if child_issue:
-                    created_issues[child_task["title"]] = child_issue
-                    total_created += 1
-                    child_task_list.append(f"- [ ] #{child_issue['number']} {child_task['title']}")
-
-            # Update parent issue with task list of children (sub-issues)
-            if parent_issue and child_task_list and not dry_run:
-                try:
-                    updated_body = parent_issue["body"] + "\n\n**Sub-tasks:**\n" + "\n".join(child_task_list)
-                    if github_client:
-                        github_client.update_issue(parent_issue["number"], body=updated_body)
-                        click.echo(f"  Updated parent issue #{parent_issue['number']} with sub-task list")
-                except Exception as e:  # noqa: BLE001 - GitHub API can raise various exceptions
-                    click.echo(f"  Warning: Failed to update parent issue with sub-tasks: {e}", err=True)
+        lines.append(f"Would create issue: {task['title']}")
+        lines.extend(f"  Would create sub-issue: {child_task['title']}" for child_task in task.get("children", []))
+    lines.append(f"Would create {len(lines) - 1} issues")
+    click.echo("\n".join(lines))
 
-    click.echo(f"Successfully created {total_created} issues")
 
+def _add_sub_task_list(github_client: GitHubClient, parent_issue: dict[str, Any], child_task_list: list[str]) -> None:
+    """Append the task list of child issues to a parent issue body."""
+    try:
+        updated_body = parent_issue["body"] + "\n\n**Sub-tasks:**\n" + "\n".join(child_task_list)
+        github_client.update_issue(parent_issue["number"], body=updated_body)
+        click.echo(f"  Updated parent issue #{parent_issue['number']} with sub-task list")
+    except click.ClickException:
+        raise
+    except Exception as e:  # noqa: BLE001 - GitHub API can raise various exceptions
+        click.echo(f"  Warning: Failed to update parent issue with sub-tasks: {e}", err=True)
 
-def _create_issue_from_task(
-    github_client: GitHubClient | None, task: dict[str, Any], parent_issue: dict[str, Any] | None, dry_run: bool
-) -> dict[str, Any] | None:
-    """Create a single GitHub issue from a task."""
-    title = task["title"]
 
+def _build_issue_body(task: dict[str, Any]) -> str:
+    """Build the issue body for a task, excluding any parent issue reference."""
     # Build description from task description array
     description_lines = [f"**Category:** {task['category']}", ""]
     if task.get("description"):
@@ -422,31 +814,30 @@ def _create_issue_from_task(
     if "priority" in task:
         description_lines.extend(["", f"**Priority:** {task['priority']}"])
 
+    return "\n".join(description_lines)
+
+
+def _create_issue_from_task(
+    github_client: GitHubClient, task: dict[str, Any], body: str, parent_issue: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
+    """Create a single GitHub issue from a task and its prebuilt body."""
+    title = task["title"]
+
     # Add parent reference if this is a child task
     if parent_issue:
-        description_lines.extend(["", f"**Parent Issue:** #{parent_issue['number']}"])
-
-    body = "\n".join(description_lines)
+        body = f"{body}\n\n**Parent Issue:** #{parent_issue['number']}"
 
     # Use tags as labels
     labels = task.get("tags", [])
 
-    click.echo(f"Creating issue: {title}")
-    if dry_run:
-        click.echo(f"  Body: {body[:100]}...")
-        click.echo(f"  Labels: {labels}")
-        if "priority" in task:
-            click.echo(f"  Priority: {task['priority']}")
-        return None
-
     try:
-        if github_client is None:
-            raise ValueError("GitHub client required for issue creation")
         issue = github_client.create_issue(title=title, body=body, labels=labels)
-        click.echo(f"  Created issue #{issue['number']}")
+        click.echo(f"  Created issue #{issue['number']}: {title}")
         return issue
+    except click.ClickException:
+        raise
     except Exception as e:  # noqa: BLE001 - GitHub API can raise various exceptions
-        click.echo(f"  Failed to create issue: {e}", err=True)
+        click.echo(f"  Failed to create issue '{title}': {e}", err=True)
         return None
 
 
@@ -0,0 +1,10 @@
+"""Shared pytest fixtures for the Release Process-O-Tron tests."""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide a CLI runner shared by the whole test session."""
+    return CliRunner()
@@ -1,434 +1,775 @@
 """Tests for the main CLI module."""
 
+import datetime
+import email.utils
+import itertools
 import json
+import re
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from relprocotron.__main__ import main
+from relprocotron.__main__ import (
+    _HAVE_ORJSON,
+    _RELEASE_TEMPLATE_NAME,
+    _RELEASE_TYPES,
+    _TEMPLATE_DIR,
+    GitHubClient,
+    _escape_json_string,
+    _get_environment,
+    _get_template,
+    main,
+)
+
+# Static release files for tests that should not depend on the bundled template
+_DATA_DIR = Path(__file__).parent / "data"
+
+# Release options shared by every generated release; tests add the release type and output file
+_BASE_ARGS = (
+    "--release-name",
+    "Test Release",
+    "--release-tag",
+    "v1.0.0",
+    "--release-date",
+    "2025-01-20",
+    "--project-url",
+    "https://github.com/test/test",
+    "--software-name",
+    "Test Software",
+    "--software-version",
+    "1.0.0",
+)
+
+# Repository and token options for issue creation tests; GitHubClient is always mocked
+_GITHUB_ARGS = ("--github-repo", "test/repo", "--github-token", "test-token")
+
+# Fields every generated release section and task must contain
+_REQUIRED_RELEASE_FIELDS = frozenset(
+    {"name", "tag", "type", "date", "project_url", "software_name", "software_version"}
+)
+_REQUIRED_TASK_FIELDS = frozenset({"title", "description", "project", "tags", "category", "priority"})
+
+
+def _load(path: Path) -> dict[str, Any]:
+    """Parse a generated release JSON file."""
+    data: dict[str, Any] = json.loads(path.read_bytes())
+    return data
+
+
+def _assert_all_in(output: str, *needles: str) -> None:
+    """Assert that every expected substring appears in the output, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"Missing from output: {missing}"
+
+
+@pytest.fixture(scope="session")
+def help_output() -> str:
+    """Provide the CLI help text, rendered once per test session without invoking the command."""
+    return main.get_help(click.Context(main))
+
+
+@pytest.fixture(scope="session")
+def release_file(runner: CliRunner, tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Provide a function that generates a release file once per release type and comments.
+
+    Callers share the generated files, so they must not be modified.
+    """
+    output_dir = tmp_path_factory.mktemp("releases")
+    cache: dict[tuple[str, tuple[str, ...]], Path] = {}
+
+    def generate(release_type: str, *comments: str) -> Path:
+        key = (release_type, comments)
+        if key not in cache:
+            output_file = output_dir / f"release_{len(cache)}.json"
+            args = [
+                *_BASE_ARGS,
+                "--release-type",
+                release_type,
+                "--output-file",
+                str(output_file),
+            ]
+            for comment in comments:
+                args.extend(["--comment", comment])
+            result = runner.invoke(main, args, catch_exceptions=False)
+            assert result.exit_code == 0, result.output
+            cache[key] = output_file
+        return cache[key]
 
+    return generate
 
-def test_main_help() -> None:
-    """Test that the main command shows help when called with --help."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
 
-    assert result.exit_code == 0
-    assert "Release Process-O-Tron CLI tool" in result.output
-    assert "--release-name" in result.output
-    assert "--release-tag" in result.output
-    assert "--release-type" in result.output
-    assert "--output-file" in result.output
+@pytest.fixture(scope="session")
+def release_json(release_file: Callable[..., Path]) -> Callable[..., dict[str, Any]]:
+    """Provide a function that returns the parsed JSON of a release from release_file.
 
+    Callers share the returned data, so it must not be modified.
+    """
+    cache: dict[Path, dict[str, Any]] = {}
 
-def test_main_with_dry_run() -> None:
-    """Test that the main command writes file regardless of dry-run flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main,
-            [
-                "--release-name",
-                "Test Release",
-                "--release-tag",
-                "v1.0.0",
-                "--release-type",
-                "LTS",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test Software",
-                "--software-version",
-                "1.0.0",
-                "--dry-run",
-                "--output-file",
-                "dry_run_output.json",
-            ],
-        )
+    def load(release_type: str, *comments: str) -> dict[str, Any]:
+        path = release_file(release_type, *comments)
+        if path not in cache:
+            cache[path] = _load(path)
+        return cache[path]
 
-        assert result.exit_code == 0
+    return load
 
-        # Verify JSON file was created even in dry run mode
-        assert Path("dry_run_output.json").exists()
 
+@pytest.fixture
+def github_client_cls() -> Iterator[Mock]:
+    """Replace GitHubClient with a mock whose create_issue returns sequentially numbered issues.
 
-def test_main_with_comments() -> None:
-    """Test that the main command handles multiple comments."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main,
-            [
-                "--release-name",
-                "Test Release",
-                "--release-tag",
-                "v1.0.0",
-                "--release-type",
-                "experimental",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test Software",
-                "--software-version",
-                "1.0.0",
-                "--comment",
-                "First comment",
-                "--comment",
-                "Second comment",
-                "--output-file",
-                "comments_output.json",
-            ],
-        )
+    The created issues are kept by title in the mock's `issues` attribute.
+    """
+    issue_numbers = itertools.count(1)
+    issues: dict[str, dict[str, Any]] = {}
 
-        assert result.exit_code == 0
+    def create_issue(title: str, body: str, labels: list[str] | None = None) -> dict[str, Any]:  # noqa: ARG001
+        issues[title] = {"number": next(issue_numbers), "title": title, "body": body}
+        return issues[title]
 
-        # Verify JSON file contains comments
-        with Path("comments_output.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        assert "comments" in data["release"]
-        assert data["release"]["comments"] == ["First comment", "Second comment"]
+    with patch("relprocotron.__main__.GitHubClient") as client_cls:
+        client_cls.issues = issues
+        client_cls.return_value.create_issue.side_effect = create_issue
+        yield client_cls
 
 
-def test_json_structure_dev_release() -> None:
-    """Test that generated JSON has correct structure for dev release."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main,
-            [
-                "--release-name",
-                "Dev Release",
-                "--release-tag",
-                "v1.0.0-dev",
-                "--release-type",
-                "dev",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test App",
-                "--software-version",
-                "1.0.0",
-                "--output-file",
-                "dev_release.json",
-            ],
-        )
+def test_main_help(help_output: str) -> None:
+    """Test that the main command's help describes the tool and its release options."""
+    _assert_all_in(
+        help_output,
+        "Release Process-O-Tron CLI tool",
+        "--release-name",
+        "--release-tag",
+        "--release-type",
+        "--output-file",
+    )
 
-        assert result.exit_code == 0
-
-        # Parse and validate JSON structure
-        with Path("dev_release.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Verify release metadata
-        assert "release" in data
-        assert data["release"]["name"] == "Dev Release"
-        assert data["release"]["tag"] == "v1.0.0-dev"
-        assert data["release"]["type"] == "dev"
-
-        # Verify tasks structure
-        assert "tasks" in data
-        assert isinstance(data["tasks"], list)
-        assert len(data["tasks"]) > 0
-
-        # Verify each task has required fields
-        for task in data["tasks"]:
-            assert "title" in task
-            assert "description" in task
-            assert "project" in task
-            assert "tags" in task
-            assert "category" in task
-            assert "priority" in task
-            assert isinstance(task["description"], list)
-            assert isinstance(task["tags"], list)
-            assert isinstance(task["priority"], int)
-
-            # Check children tasks if they exist
-            if "children" in task:
-                for child in task["children"]:
-                    assert "title" in child
-                    assert "description" in child
-                    assert "project" in child
-                    assert "tags" in child
-                    assert "category" in child
-                    assert "priority" in child
-
-
-def test_json_structure_lts_release() -> None:
-    """Test that generated JSON includes publication tasks for LTS release."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main,
-            [
-                "--release-name",
-                "LTS Release",
-                "--release-tag",
-                "v2.0.0",
-                "--release-type",
-                "LTS",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test App",
-                "--software-version",
-                "2.0.0",
-                "--output-file",
-                "lts_release.json",
-            ],
-        )
 
-        assert result.exit_code == 0
+def test_main_version(runner: CliRunner) -> None:
+    """Test that the main command reports the package name and version."""
+    result = runner.invoke(main, ["--version"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert result.output.startswith("release-process-o-tron v")
 
-        # Parse and validate JSON structure
-        with Path("lts_release.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
 
-        # Verify publication task exists for LTS release
-        task_titles = [task["title"] for task in data["tasks"]]
-        assert "Publication" in task_titles
+def test_main_with_dry_run(runner: CliRunner, tmp_path: Path) -> None:
+    """Test that the main command writes file regardless of dry-run flag."""
+    result = runner.invoke(
+        main,
+        [
+            *_BASE_ARGS,
+            "--release-type",
+            "LTS",
+            "--dry-run",
+            "--output-file",
+            str(tmp_path / "dry_run_output.json"),
+        ],
+        catch_exceptions=False,
+    )
 
+    assert result.exit_code == 0
 
-def test_json_validity_all_release_types() -> None:
+    # Verify JSON file was created even in dry run mode
+    assert (tmp_path / "dry_run_output.json").exists()
+
+
+def test_json_structure_lts_release(release_json: Callable[..., dict[str, Any]]) -> None:
+    """Test that generated JSON includes publication tasks for LTS release."""
+    data = release_json("LTS")
+
+    # Verify publication task exists for LTS release
+    assert any(task["title"] == "Publication" for task in data["tasks"]), "LTS release must contain Publication task"
+
+
+@pytest.mark.parametrize("release_type", _RELEASE_TYPES)
+def test_json_validity_all_release_types(release_file: Callable[..., Path], release_type: str) -> None:
     """Test that generated JSON is valid for all supported release types."""
-    runner = CliRunner()
-    release_types = ["dev", "LTS", "experimental", "early-access"]
-
-    for release_type in release_types:
-        with runner.isolated_filesystem():
-            # Test basic release generation
-            result = runner.invoke(
-                main,
-                [
-                    "--release-name",
-                    f"{release_type.title()} Release",
-                    "--release-tag",
-                    f"v1.0.0-{release_type.lower()}",
-                    "--release-type",
-                    release_type,
-                    "--release-date",
-                    "2025-01-20",
-                    "--project-url",
-                    "https://github.com/test/test",
-                    "--software-name",
-                    "Test App",
-                    "--software-version",
-                    "1.0.0",
-                    "--output-file",
-                    f"{release_type}_release.json",
-                ],
-            )
-
-            assert result.exit_code == 0, f"CLI failed for release type: {release_type}"
-
-            # Validate JSON is syntactically correct
-            json_file = Path(f"{release_type}_release.json")
-            assert json_file.exists(), f"JSON file not created for release type: {release_type}"
-
-            with json_file.open("r", encoding="utf-8") as f:
-                content = f.read()
-                assert content.strip(), f"JSON file is empty for release type: {release_type}"
-
-                # Validate JSON can be parsed without errors
-                try:
-                    data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    raise AssertionError(f"Invalid JSON generated for release type {release_type}: {e}") from e
-
-                # Validate JSON can be re-serialized (round-trip test)
-                try:
-                    re_serialized = json.dumps(data, indent=2)
-                    re_parsed = json.loads(re_serialized)
-                    assert isinstance(re_parsed, dict), f"JSON structure invalid for release type: {release_type}"
-                except (TypeError, ValueError) as e:
-                    raise AssertionError(f"JSON round-trip failed for release type {release_type}: {e}") from e
-
-
-def test_json_validity_with_comments() -> None:
-    """Test that generated JSON is valid when comments are included."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Test with multiple comments
+    # Validate JSON is syntactically correct
+    content = release_file(release_type).read_bytes()
+    assert content.strip(), f"JSON file is empty for release type: {release_type}"
+
+    # Validate JSON can be parsed without errors
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise AssertionError(f"Invalid JSON generated for release type {release_type}: {e}") from e
+    assert isinstance(data, dict), f"JSON root must be an object for release type: {release_type}"
+
+
+@pytest.mark.parametrize(
+    "comments",
+    [
+        pytest.param(("First comment", "Second comment"), id="basic"),
+        pytest.param(
+            (
+                "First comment with special chars: áéíóú",
+                'Second comment with quotes and "escapes"',
+                "Third comment with newlines\nand\ttabs",
+            ),
+            id="unicode-escape-newlines",
+        ),
+    ],
+)
+def test_json_validity_with_comments(release_file: Callable[..., Path], comments: tuple[str, ...]) -> None:
+    """Test that generated JSON is valid and keeps every comment verbatim."""
+    content = release_file("dev", *comments).read_bytes()
+
+    # Validate JSON parsing
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise AssertionError(f"Invalid JSON generated with comments: {e}") from e
+
+    # Validate comments are properly escaped and included in order
+    assert data["release"]["comments"] == list(comments)
+
+
+@pytest.mark.parametrize("comment", [pytest.param("Plain comment", id="ascii"), pytest.param("日本語", id="non-ascii")])
+def test_main_writes_to_stdout(comment: str) -> None:
+    """Test that an output file of "-" writes UTF-8 release JSON to standard output, even on a non-UTF-8 console."""
+    runner = CliRunner(charset="cp1252")
+    result = runner.invoke(
+        main,
+        [*_BASE_ARGS, "--release-type", "dev", "--comment", comment, "--output-file", "-"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout_bytes)
+    assert data["release"]["type"] == "dev"
+    assert data["release"]["comments"] == [comment]
+    assert data["tasks"]
+
+
+def test_main_ignores_foreign_template_bytecode_cache(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that compiled templates cached by a differently configured Jinja2 environment are not reused."""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    # An environment without JSON escaping caches its compiled template in the shared per-user directory
+    foreign_environment = Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=False,  # noqa: S701 - JSON output, not HTML
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    foreign_environment.get_template(_RELEASE_TEMPLATE_NAME)
+    _get_template.cache_clear()
+    _get_environment.cache_clear()
+    try:
+        output_file = tmp_path / "release.json"
         result = runner.invoke(
             main,
             [
+                *_BASE_ARGS,
                 "--release-name",
-                "Commented Release",
-                "--release-tag",
-                "v1.0.0",
+                'Quoted "name"',
                 "--release-type",
                 "dev",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test App",
-                "--software-version",
-                "1.0.0",
-                "--comment",
-                "First comment with special chars: áéíóú",
-                "--comment",
-                'Second comment with quotes and "escapes"',
-                "--comment",
-                "Third comment with newlines\nand\ttabs",
                 "--output-file",
-                "commented_release.json",
+                str(output_file),
             ],
+            catch_exceptions=False,
         )
+    finally:
+        # Later tests should get an environment built with the real temp directory
+        _get_template.cache_clear()
+        _get_environment.cache_clear()
 
-        assert result.exit_code == 0
-
-        # Validate JSON with complex comment content
-        with Path("commented_release.json").open("r", encoding="utf-8") as f:
-            content = f.read()
-
-            # Validate JSON parsing
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
-                raise AssertionError(f"Invalid JSON generated with comments: {e}") from e
-
-            # Validate comments are properly escaped and included
-            assert "comments" in data["release"]
-            assert len(data["release"]["comments"]) == 3
-            assert "áéíóú" in data["release"]["comments"][0]
-            assert '"escapes"' in data["release"]["comments"][1]
-            assert "\n" in data["release"]["comments"][2]
+    assert result.exit_code == 0
+    assert _load(output_file)["release"]["name"] == 'Quoted "name"'
 
 
-def test_json_structure_consistency() -> None:
-    """Test that JSON structure is consistent and contains required fields."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
+def test_main_without_usable_temp_dir(runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that generation still works when the template bytecode cache directory cannot be created."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "missing" / "dir"))
+    _get_template.cache_clear()
+    _get_environment.cache_clear()
+    try:
+        assert _get_environment().bytecode_cache is None
+        output_file = tmp_path / "no_cache_release.json"
         result = runner.invoke(
-            main,
-            [
-                "--release-name",
-                "Structure Test",
-                "--release-tag",
-                "v1.0.0",
-                "--release-type",
-                "LTS",
-                "--release-date",
-                "2025-01-20",
-                "--project-url",
-                "https://github.com/test/test",
-                "--software-name",
-                "Test App",
-                "--software-version",
-                "1.0.0",
-                "--output-file",
-                "structure_test.json",
-            ],
+            main, [*_BASE_ARGS, "--release-type", "dev", "--output-file", str(output_file)], catch_exceptions=False
         )
+    finally:
+        # Later tests should get an environment built with the real temp directory
+        _get_template.cache_clear()
+        _get_environment.cache_clear()
 
-        assert result.exit_code == 0
-
-        with Path("structure_test.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-            # Validate top-level structure
-            assert isinstance(data, dict), "Root JSON element must be an object"
-            assert "release" in data, "JSON must contain 'release' section"
-            assert "tasks" in data, "JSON must contain 'tasks' section"
-
-            # Validate release section
-            release = data["release"]
-            required_release_fields = [
-                "name",
-                "tag",
-                "type",
-                "date",
-                "project_url",
-                "software_name",
-                "software_version",
-            ]
-            for field in required_release_fields:
-                assert field in release, f"Release section missing required field: {field}"
-                assert isinstance(release[field], str), f"Release field '{field}' must be a string"
-
-            # Validate tasks section
-            tasks = data["tasks"]
-            assert isinstance(tasks, list), "Tasks must be a list"
-            assert len(tasks) > 0, "Must have at least one task"
-
-            # Validate each task structure
-            for i, task in enumerate(tasks):
-                assert isinstance(task, dict), f"Task {i} must be an object"
-                required_task_fields = ["title", "description", "project", "tags", "category", "priority"]
-                for field in required_task_fields:
-                    assert field in task, f"Task {i} missing required field: {field}"
-
-                # Validate field types
-                assert isinstance(task["title"], str), f"Task {i} title must be a string"
-                assert isinstance(task["description"], list), f"Task {i} description must be a list"
-                assert isinstance(task["project"], str), f"Task {i} project must be a string"
-                assert isinstance(task["tags"], list), f"Task {i} tags must be a list"
-                assert isinstance(task["category"], str), f"Task {i} category must be a string"
-                assert isinstance(task["priority"], int), f"Task {i} priority must be an integer"
-
-                # Validate children structure if present
-                if "children" in task:
-                    assert isinstance(task["children"], list), f"Task {i} children must be a list"
-                    for j, child in enumerate(task["children"]):
-                        assert isinstance(child, dict), f"Task {i} child {j} must be an object"
-                        for field in required_task_fields:
-                            assert field in child, f"Task {i} child {j} missing required field: {field}"
-
-
-def test_priority_field_in_generated_json() -> None:
+    assert result.exit_code == 0
+    assert _load(output_file)["release"]["type"] == "dev"
+
+
+@pytest.mark.parametrize(
+    "have_orjson",
+    [
+        pytest.param(True, id="orjson", marks=pytest.mark.skipif(not _HAVE_ORJSON, reason="orjson is not installed")),
+        pytest.param(False, id="stdlib"),
+    ],
+)
+def test_unencodable_release_value_keeps_previous_output(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, have_orjson: bool
+) -> None:
+    """Test that a release value that is not valid UTF-8 is reported and leaves an existing output file untouched."""
+    monkeypatch.setattr("relprocotron.__main__._HAVE_ORJSON", have_orjson)
+    output_file = tmp_path / "release.json"
+    output_file.write_text("previous", encoding="utf-8")
+
+    # An undecodable command line byte, as Python passes it on through surrogateescape
+    args = [*_BASE_ARGS, "--release-type", "dev", "--comment", "\udcff", "--output-file", str(output_file)]
+    result = runner.invoke(main, args)
+
+    assert result.exit_code == 1
+    assert "Release values must be valid UTF-8 text" in result.stderr
+    assert output_file.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+def test_json_validity_with_special_characters_in_release_fields(runner: CliRunner, tmp_path: Path) -> None:
+    """Test that generated JSON is valid when release fields contain JSON metacharacters."""
+    result = runner.invoke(
+        main,
+        [
+            "--release-name",
+            'Release "Quoted" \\ Name',
+            "--release-tag",
+            "v1.0.0",
+            "--release-type",
+            "LTS",
+            "--release-date",
+            "2025-01-20",
+            "--project-url",
+            "https://github.com/test/test",
+            "--software-name",
+            "Test <App> & Co",
+            "--software-version",
+            "1.0.0",
+            "--output-file",
+            str(tmp_path / "special_release.json"),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+
+    data = _load(tmp_path / "special_release.json")
+
+    assert data["release"]["name"] == 'Release "Quoted" \\ Name'
+    assert data["release"]["software_name"] == "Test <App> & Co"
+    assert all(task["project"] == "Test <App> & Co" for task in data["tasks"])
+
+
+@pytest.mark.parametrize("release_type", _RELEASE_TYPES)
+def test_json_structure_consistency(release_json: Callable[..., dict[str, Any]], release_type: str) -> None:
+    """Test that JSON structure is consistent and contains required fields for every release type."""
+    data = release_json(release_type)
+
+    # Validate top-level structure
+    assert isinstance(data, dict), "Root JSON element must be an object"
+    assert "release" in data, "JSON must contain 'release' section"
+    assert "tasks" in data, "JSON must contain 'tasks' section"
+
+    # Validate release section
+    release = data["release"]
+    missing = _REQUIRED_RELEASE_FIELDS - release.keys()
+    assert not missing, f"Release section missing required fields: {sorted(missing)}"
+    for field in _REQUIRED_RELEASE_FIELDS:
+        assert isinstance(release[field], str), f"Release field '{field}' must be a string"
+    assert (release["name"], release["tag"], release["type"]) == ("Test Release", "v1.0.0", release_type)
+
+    # Validate tasks section
+    tasks = data["tasks"]
+    assert isinstance(tasks, list), "Tasks must be a list"
+    assert len(tasks) > 0, "Must have at least one task"
+
+    # Validate each task structure
+    for i, task in enumerate(tasks):
+        assert isinstance(task, dict), f"Task {i} must be an object"
+        missing = _REQUIRED_TASK_FIELDS - task.keys()
+        assert not missing, f"Task {i} missing required fields: {sorted(missing)}"
+
+        # Validate field types
+        assert isinstance(task["title"], str), f"Task {i} title must be a string"
+        assert isinstance(task["description"], list), f"Task {i} description must be a list"
+        assert isinstance(task["project"], str), f"Task {i} project must be a string"
+        assert isinstance(task["tags"], list), f"Task {i} tags must be a list"
+        assert isinstance(task["category"], str), f"Task {i} category must be a string"
+        assert isinstance(task["priority"], int), f"Task {i} priority must be an integer"
+
+        # Validate children structure if present
+        if "children" in task:
+            assert isinstance(task["children"], list), f"Task {i} children must be a list"
+            for j, child in enumerate(task["children"]):
+                assert isinstance(child, dict), f"Task {i} child {j} must be an object"
+                missing = _REQUIRED_TASK_FIELDS - child.keys()
+                assert not missing, f"Task {i} child {j} missing required fields: {sorted(missing)}"
+
+
+def test_priority_field_in_generated_json(release_json: Callable[..., dict[str, Any]]) -> None:
     """Test that priority field is included in generated JSON tasks."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main,
-            [
+    data = release_json("dev")
+
+    # Check that every task and child task has a positive integer priority
+    tasks = data["tasks"]
+    all_tasks = [*tasks, *itertools.chain.from_iterable(task.get("children", []) for task in tasks)]
+    invalid = [
+        task["title"] for task in all_tasks if not (isinstance(task.get("priority"), int) and task["priority"] > 0)
+    ]
+    assert not invalid, f"Tasks without a positive integer priority: {invalid}"
+
+    # Check that tasks are in different priority groups
+    assert len({task["priority"] for task in tasks}) > 1, "Tasks should have different priorities for ordering"
+
+
+@pytest.mark.parametrize(
+    "have_orjson",
+    [
+        pytest.param(True, id="orjson", marks=pytest.mark.skipif(not _HAVE_ORJSON, reason="orjson is not installed")),
+        pytest.param(False, id="stdlib"),
+    ],
+)
+def test_escape_json_string(monkeypatch: pytest.MonkeyPatch, have_orjson: bool) -> None:
+    """Test that template values are escaped as the body of a JSON string, with and without orjson."""
+    monkeypatch.setattr("relprocotron.__main__._HAVE_ORJSON", have_orjson)
+    values = ['Quoted "name"', "back\\slash", "tab\tnew\nline", "áéíóú <&>", "\x00\x1f", 42]
+
+    assert [_escape_json_string(value) for value in values] == [
+        json.dumps(str(value), ensure_ascii=False)[1:-1] for value in values
+    ]
+
+
+def test_create_issues_creates_parent_and_child_issues(
+    runner: CliRunner, release_file: Callable[..., Path], github_client_cls: Mock
+) -> None:
+    """Test that issue creation creates every task and links children to their parents."""
+    input_file = release_file("LTS")
+    data = _load(input_file)
+    parents_with_children = [task for task in data["tasks"] if task.get("children")]
+    expected_total = len(data["tasks"]) + sum(len(task["children"]) for task in parents_with_children)
+
+    result = runner.invoke(
+        main, ["--create-issues", "--input-file", str(input_file), *_GITHUB_ARGS], catch_exceptions=False
+    )
+
+    client = github_client_cls.return_value
+    assert result.exit_code == 0
+    assert f"Successfully created {expected_total} issues" in result.output
+    assert client.create_issue.call_count == expected_total
+    assert client.update_issue.call_count == len(parents_with_children)
+
+    # Each child links to its own parent, and each parent lists its children in priority order
+    issues = github_client_cls.issues
+    sub_task_lists = {call.args[0]: call.kwargs["body"] for call in client.update_issue.call_args_list}
+    for task in parents_with_children:
+        parent_number = issues[task["title"]]["number"]
+        children = sorted(task["children"], key=lambda child: child["priority"])
+        for child in children:
+            assert issues[child["title"]]["body"].endswith(f"**Parent Issue:** #{parent_number}")
+        expected_list = "\n".join(f"- [ ] #{issues[child['title']]['number']} {child['title']}" for child in children)
+        assert sub_task_lists[parent_number].endswith(f"**Sub-tasks:**\n{expected_list}")
+
+
+def test_create_issues_dry_run(runner: CliRunner, github_client_cls: Mock) -> None:
+    """Test that a dry run lists the issues to create in priority order without contacting GitHub."""
+    result = runner.invoke(
+        main,
+        ["--create-issues", "--dry-run", "--input-file", str(_DATA_DIR / "minimal_release.json"), *_GITHUB_ARGS],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "Creating GitHub issues for release: Minimal Release",
+        "DRY RUN: No actual issues will be created",
+        "Would create issue: Code Quality",
+        "  Would create sub-issue: Linting",
+        "  Would create sub-issue: Type Checking",
+        "Would create issue: Publication",
+        "Would create 4 issues",
+    ]
+    github_client_cls.assert_not_called()
+
+
+def test_main_missing_required_args(runner: CliRunner) -> None:
+    """Test that JSON generation without every release option is a usage error naming the missing options."""
+    result = runner.invoke(main, ["--release-name", "Test Release", "--release-type", "dev"])
+
+    assert result.exit_code == 2
+    assert result.stdout == ""
+    assert result.stderr.count("Missing required options") == 1
+    assert (
+        "Missing required options for JSON generation: --release-tag, --release-date, --project-url, "
+        "--software-name, --software-version, --output-file"
+    ) in result.stderr
+
+
+def test_create_issues_missing_parameters() -> None:
+    """Test that issue creation without its input file, repository and token is a usage error."""
+    with pytest.raises(click.UsageError, match="Missing required options for issue creation"):
+        main.main(args=["--create-issues", "--github-repo", "test/repo"], standalone_mode=False)
+
+
+@pytest.mark.parametrize("release_date", ["2025-02-30", "20250120", "2025-W03-1", "2025-1-20"])
+def test_invalid_release_date(tmp_path: Path, release_date: str) -> None:
+    """Test that an invalid release date is rejected before any output is written."""
+    with pytest.raises(click.BadParameter, match="is not a valid date in YYYY-MM-DD format"):
+        main.main(
+            args=[
                 "--release-name",
-                "Priority Test",
+                "Test Release",
                 "--release-tag",
                 "v1.0.0",
                 "--release-type",
                 "dev",
                 "--release-date",
-                "2025-01-20",
+                release_date,
                 "--project-url",
                 "https://github.com/test/test",
                 "--software-name",
-                "Test App",
+                "Test Software",
                 "--software-version",
                 "1.0.0",
                 "--output-file",
-                "priority_test.json",
+                str(tmp_path / "invalid_date.json"),
             ],
+            standalone_mode=False,
         )
 
-        assert result.exit_code == 0
+    assert not (tmp_path / "invalid_date.json").exists()
+
+
+def test_batch_generates_every_release(runner: CliRunner, tmp_path: Path) -> None:
+    """Test that batch mode writes one release file per JSON Lines entry."""
+    releases: list[dict[str, Any]] = [
+        {
+            "release_name": f"{release_type} Release",
+            "release_tag": "v1.0.0",
+            "release_type": release_type,
+            "release_date": "2025-01-20",
+            "project_url": "https://github.com/test/test",
+            "software_name": "Test App",
+            "software_version": "1.0.0",
+            "output_file": str(tmp_path / "batch" / f"{release_type}.json"),
+        }
+        for release_type in ["dev", "LTS"]
+    ]
+    releases[1]["comments"] = ["Batch comment"]
+    batch_file = tmp_path / "releases.jsonl"
+    batch_file.write_text("\n".join(json.dumps(release) for release in releases), encoding="utf-8")
+
+    result = runner.invoke(main, ["--batch", str(batch_file)], catch_exceptions=False)
 
-        # Parse and validate priority fields
-        with Path("priority_test.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Check that all tasks have priority field
-        for task in data["tasks"]:
-            assert "priority" in task, f"Task '{task['title']}' missing priority field"
-            assert isinstance(task["priority"], int), f"Task '{task['title']}' priority must be integer"
-            assert task["priority"] > 0, f"Task '{task['title']}' priority must be positive"
-
-            # Check children tasks if they exist
-            if "children" in task:
-                for child in task["children"]:
-                    assert "priority" in child, f"Child task '{child['title']}' missing priority field"
-                    assert isinstance(child["priority"], int), f"Child task '{child['title']}' priority must be integer"
-                    assert child["priority"] > 0, f"Child task '{child['title']}' priority must be positive"
-
-        # Check that tasks are in different priority groups
-        priorities = [task["priority"] for task in data["tasks"]]
-        assert len(set(priorities)) > 1, "Tasks should have different priorities for ordering"
+    assert result.exit_code == 0
+    for release in releases:
+        assert f"Release activities written to: {release['output_file']}" in result.output
+        data = _load(Path(release["output_file"]))
+        assert data["release"]["name"] == release["release_name"]
+        assert data["release"]["type"] == release["release_type"]
+    assert data["release"]["comments"] == ["Batch comment"]
+
+
+def test_batch_rejects_incomplete_release(tmp_path: Path) -> None:
+    """Test that batch mode reports the line of a release with missing fields."""
+    batch_file = tmp_path / "releases.jsonl"
+    batch_file.write_text('{"release_name": "Incomplete"}\n', encoding="utf-8")
+
+    with pytest.raises(click.ClickException, match=re.escape(f"Release on line 1 of {batch_file} is missing fields")):
+        main.main(args=["--batch", str(batch_file)], standalone_mode=False)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        pytest.param({"release_name": None}, "must have non-empty string values for: release_name", id="null-field"),
+        pytest.param({"software_version": ""}, "must have non-empty string values for: software_version", id="empty"),
+        pytest.param({"comments": "abc"}, "Comments on line 2 of .* must be a list of strings", id="string-comments"),
+        pytest.param({"release_date": "2025-13-01"}, "'2025-13-01' is not a valid date .* on line 2 of", id="bad-date"),
+        pytest.param({"output_file": "-"}, "cannot write to standard output in batch mode", id="stdout"),
+    ],
+)
+def test_batch_rejects_invalid_release(tmp_path: Path, overrides: dict[str, Any], message: str) -> None:
+    """Test that batch mode reports the line of an invalid release before writing any release."""
+    valid_release = {
+        "release_name": "Test Release",
+        "release_tag": "v1.0.0",
+        "release_type": "dev",
+        "release_date": "2025-01-20",
+        "project_url": "https://github.com/test/test",
+        "software_name": "Test App",
+        "software_version": "1.0.0",
+        "output_file": str(tmp_path / "valid.json"),
+    }
+    invalid_release = {**valid_release, "output_file": str(tmp_path / "invalid.json"), **overrides}
+    batch_file = tmp_path / "releases.jsonl"
+    batch_file.write_text(f"{json.dumps(valid_release)}\n{json.dumps(invalid_release)}\n", encoding="utf-8")
+
+    with pytest.raises(click.ClickException, match=message):
+        main.main(args=["--batch", str(batch_file)], standalone_mode=False)
+    assert not list(tmp_path.glob("*.json"))
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        pytest.param(["--release-type", "dev", "--comment", "Ignored"], "--release-type, --comment", id="release"),
+        pytest.param(["--dry-run"], "--dry-run", id="dry-run"),
+        pytest.param(["--create-issues", *_GITHUB_ARGS], "--create-issues, --github-repo", id="create-issues"),
+    ],
+)
+def test_batch_rejects_other_options(runner: CliRunner, tmp_path: Path, options: list[str], message: str) -> None:
+    """Test that other options cannot be combined with --batch, rather than being silently ignored."""
+    batch_file = tmp_path / "releases.jsonl"
+    batch_file.write_text("", encoding="utf-8")
+
+    result = runner.invoke(main, ["--batch", str(batch_file), *options])
+
+    assert result.exit_code == 2
+    assert f"--batch cannot be combined with: {message}" in result.output
+
+
+def test_github_client_request_dispatch() -> None:
+    """Test that API requests go through the session with the payload and reject unknown methods."""
+    client = GitHubClient("test-token", "test/repo")
+    response = Mock(status_code=201, json=Mock(return_value={"number": 7}))
+
+    with patch.object(client.session, "request", return_value=response) as request:
+        issue = client.create_issue(title="Title", body="Body", labels=["bug"])
+
+    assert issue == {"number": 7}
+    method, url = request.call_args.args
+    assert (method, url) == ("POST", "https://api.github.com/repos/test/repo/issues")
+    assert request.call_args.kwargs["json"] == {"title": "Title", "body": "Body", "labels": ["bug"]}
+
+    with pytest.raises(ValueError, match="Unsupported HTTP method"):
+        client._make_request("DELETE", "/repos/test/repo/issues/7")
+
+
+def test_github_client_retry_delays() -> None:
+    """Test that rate-limited requests honour Retry-After and otherwise use capped, jittered backoff."""
+    client = GitHubClient("test-token", "test/repo")
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "5"})
+    rate_limited_no_header = Mock(status_code=429, headers={})
+    ok = Mock(status_code=200, json=Mock(return_value={"number": 1}))
+    with (
+        patch.object(client.session, "request", side_effect=[rate_limited, rate_limited_no_header, ok]),
+        patch("relprocotron.__main__.time.sleep") as sleep,
+    ):
+        assert client.get_issue(1) == {"number": 1}
+
+    first_delay, second_delay = (call.args[0] for call in sleep.call_args_list)
+    assert 5.0 <= first_delay <= 5.5
+    assert 2.0 <= second_delay <= 2.5
+
+    with (
+        patch.object(client.session, "request", side_effect=[rate_limited_no_header, ok]),
+        patch("relprocotron.__main__.time.sleep") as sleep,
+    ):
+        client._make_request("GET", "/repos/test/repo/issues/1", max_retries=20, base_delay=1000.0)
+    assert 60.0 <= sleep.call_args.args[0] <= 60.5
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "minimum", "maximum"),
+    [
+        pytest.param("120", 120.0, 120.5, id="seconds-beyond-backoff-cap"),
+        pytest.param("Wed, 21 Oct 2015 07:28:00 GMT", 0.0, 0.5, id="http-date-in-past"),
+        pytest.param("next Tuesday", 1.0, 1.5, id="malformed"),
+    ],
+)
+def test_github_client_retry_after_header(retry_after: str, minimum: float, maximum: float) -> None:
+    """Test that Retry-After waits are capped and jittered, and malformed values fall back to backoff."""
+    client = GitHubClient("test-token", "test/repo")
+    rate_limited = Mock(status_code=429, headers={"Retry-After": retry_after})
+    ok = Mock(status_code=200, json=Mock(return_value={"number": 1}))
+
+    with (
+        patch.object(client.session, "request", side_effect=[rate_limited, ok]),
+        patch("relprocotron.__main__.time.sleep") as sleep,
+    ):
+        assert client.get_issue(1) == {"number": 1}
+
+    assert minimum <= sleep.call_args.args[0] <= maximum
+
+
+def test_github_client_long_retry_after_aborts(runner: CliRunner, github_client_cls: Mock) -> None:
+    """Test that a Retry-After wait too long to sit out ends the run instead of retrying early."""
+    client = GitHubClient("test-token", "test/repo")
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "3600"})
+
+    with (
+        patch.object(client.session, "request", return_value=rate_limited) as request,
+        patch("relprocotron.__main__.time.sleep") as sleep,
+        pytest.raises(click.ClickException, match="retry after 3600 seconds"),
+    ):
+        client.get_issue(1)
+
+    assert request.call_count == 1
+    sleep.assert_not_called()
+
+    # Issue creation stops rather than carrying on with the remaining issues
+    github_client_cls.return_value.create_issue.side_effect = click.ClickException("retry after 3600 seconds")
+    result = runner.invoke(
+        main, ["--create-issues", "--input-file", str(_DATA_DIR / "minimal_release.json"), *_GITHUB_ARGS]
+    )
+    assert result.exit_code == 1
+    assert "retry after 3600 seconds" in result.output
+    assert "Successfully created" not in result.output
+    github_client_cls.return_value.update_issue.assert_not_called()
+
+
+def test_github_client_retries_secondary_rate_limit() -> None:
+    """Test that a 403 with Retry-After, as sent for GitHub's secondary rate limits, is retried after the wait."""
+    client = GitHubClient("test-token", "test/repo")
+    rate_limited = Mock(status_code=403, headers={"Retry-After": "2"})
+    ok = Mock(status_code=200, json=Mock(return_value={"number": 1}))
+
+    with (
+        patch.object(client.session, "request", side_effect=[rate_limited, ok]),
+        patch("relprocotron.__main__.time.sleep") as sleep,
+    ):
+        assert client.get_issue(1) == {"number": 1}
+
+    assert 2.0 <= sleep.call_args.args[0] <= 2.5
+
+
+def test_github_client_session_per_thread() -> None:
+    """Test that each pool worker opens one session of its own, and that the client closes them all."""
+    client = GitHubClient("test-token", "test/repo")
+    with ThreadPoolExecutor(max_workers=2, initializer=client.open_session) as executor:
+        worker_sessions = set(executor.map(lambda _: client.session, range(8)))
+
+    assert len(worker_sessions) <= 2
+    assert client.session is client.session
+    assert client.session not in worker_sessions
+    assert all(session.headers["Authorization"] == "token test-token" for session in worker_sessions)
+
+    with patch("requests.Session.close") as close:
+        client.close()
+    # One session per started worker, plus the one opened by this thread
+    assert len(worker_sessions) + 1 <= close.call_count <= 3
+
+
+def test_github_client_retry_after_http_date() -> None:
+    """Test that a Retry-After HTTP-date in the future waits until that time."""
+    client = GitHubClient("test-token", "test/repo")
+    retry_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=30)
+    rate_limited = Mock(status_code=429, headers={"Retry-After": email.utils.format_datetime(retry_at, usegmt=True)})
+    ok = Mock(status_code=200, json=Mock(return_value={"number": 1}))
+
+    with (
+        patch.object(client.session, "request", side_effect=[rate_limited, ok]),
+        patch("relprocotron.__main__.time.sleep") as sleep,
+    ):
+        assert client.get_issue(1) == {"number": 1}
+
+    assert 28.0 <= sleep.call_args.args[0] <= 30.5